@@ -2,14 +2,35 @@ import copy
 import json
 import logging
 import sys
+from contextvars import ContextVar
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
 
 import tomli
-from pydantic import (BaseModel, ConfigDict, Field, ValidationError,
-                      field_validator)
+from pydantic import (BaseModel, ConfigDict, Field, TypeAdapter,
+                      ValidationError, field_validator)
 from stashapi import log as stash_log
-from stashapi.stashapp import StashInterface
+
+try:  # optional speedup; the plugin environment may not ship orjson
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps_bytes(data: Any) -> bytes:
+        return orjson.dumps(data)
+
+    def _json_dumps(data: Any) -> str:
+        return orjson.dumps(data, default=str).decode()
+
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps_bytes(data: Any) -> bytes:
+        return json.dumps(data).encode()
+
+    def _json_dumps(data: Any) -> str:
+        return json.dumps(data, default=str)
 
 
 # =========================
@@ -27,7 +48,8 @@ class PluginConfig(BaseModel):
     WHISPARR_RENAME: bool = True
     QUALITY_PROFILE: str = "Any"
     ROOT_FOLDER: Optional[Path] = None
-    IGNORE_TAGS: List[str] = Field(default_factory=list)
+    IGNORE_TAGS: FrozenSet[str] = Field(default_factory=frozenset)
+    SYNC_WORKERS: int = 4
     DEV_MODE: bool = False
 
     # Logging
@@ -47,8 +69,9 @@ class PluginConfig(BaseModel):
     # Limits
     MAX_LOG_BODY: int = 1000
     MAX_PATH_LENGTH: int = 100
+    BATCH_SIZE: int = 50
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", defer_build=True)
 
     # ----------------------
     # Validators
@@ -57,15 +80,30 @@ class PluginConfig(BaseModel):
     @classmethod
     def normalize_ignore_tags(cls, v):
         if not v:
-            return []
+            return frozenset()
         if isinstance(v, str):
             try:
                 parsed = json.loads(v)
                 if isinstance(parsed, list):
-                    return [str(tag) for tag in parsed]
+                    return frozenset(str(tag) for tag in parsed)
             except json.JSONDecodeError:
-                return [t.strip() for t in v.split(",") if t.strip()]
-        return list(v)
+                return frozenset(t.strip() for t in v.split(",") if t.strip())
+        return frozenset(v)
+
+    @field_validator("PATH_MAPPING", mode="before")
+    @classmethod
+    def normalize_path_mapping(cls, v):
+        if not v:
+            return {}
+        # Normalize prefixes once at load so per-path lookups are plain
+        # string comparisons.
+        normalized = {
+            Path(server).as_posix().rstrip("/"): Path(local).as_posix().rstrip("/")
+            for server, local in dict(v).items()
+        }
+        # Longest prefix first: the most specific mapping wins and the
+        # per-path scan can stop at the first match.
+        return dict(sorted(normalized.items(), key=lambda kv: -len(kv[0])))
 
     @field_validator("LOG_FILE_LOCATION", "ROOT_FOLDER", mode="before")
     @classmethod
@@ -82,6 +120,18 @@ class PluginConfig(BaseModel):
         return v.strip()
 
 
+# Built once on first use so repeated plugin loads reuse the compiled
+# validator without paying schema construction at import time.
+_CONFIG_ADAPTER: Optional[TypeAdapter] = None
+
+
+def _config_adapter() -> TypeAdapter:
+    global _CONFIG_ADAPTER
+    if _CONFIG_ADAPTER is None:
+        _CONFIG_ADAPTER = TypeAdapter(PluginConfig)
+    return _CONFIG_ADAPTER
+
+
 # =========================
 # Config Loaders
 # =========================
@@ -115,6 +165,8 @@ def load_plugin_config(
 
     # ---- STASH UI ----
     if stash:
+        from stashapi.stashapp import StashInterface
+
         stash_api = StashInterface(stash["server_connection"])
         try:
             stash_config = stash_api.get_configuration()
@@ -126,7 +178,7 @@ def load_plugin_config(
 
     # ---- VALIDATE ONCE ----
     try:
-        config = PluginConfig.model_validate(merged)
+        config = _config_adapter().validate_python(merged)
     except ValidationError as e:
         stash_log.error(f"Configuration validation failed: {e}")
         raise
@@ -136,8 +188,8 @@ def load_plugin_config(
         stash_log.error("Whisparr URL and API key must be set in config.")
         raise ValueError("Missing critical Whisparr configuration fields")
 
-    # if config.DEV_MODE:
-    stash_log.debug(f"Config Loaded as {safe_json_preview(config)}")
+    if config.DEV_MODE:
+        stash_log.debug(f"Config Loaded as {safe_json_preview(config)}")
 
     return config
 
@@ -148,15 +200,15 @@ def load_plugin_config(
 CONFIG: Optional[PluginConfig] = None
 
 
+@lru_cache(maxsize=2048)
+def _truncate_str(s: str, limit: int) -> str:
+    return s if len(s) <= limit else f"...{s[-(limit - 3):]}"
+
+
 def truncate_path(p: Path) -> str:
-    s = str(p)
-    if CONFIG is None:
-        return s if len(s) <= 100 else f"...{s[-97:]}"
-    return (
-        s
-        if len(s) <= CONFIG.MAX_PATH_LENGTH
-        else f"...{s[-(CONFIG.MAX_PATH_LENGTH-3):]}"
-    )
+    # Scene paths repeat across a scene's lifecycle, so the truncated
+    # string is cached per (path, limit).
+    return _truncate_str(str(p), CONFIG.MAX_PATH_LENGTH if CONFIG else 100)
 
 
 def safe_json_preview(data: Any) -> str:
@@ -167,9 +219,9 @@ def safe_json_preview(data: Any) -> str:
             for k in ("apiKey", "X-Api-Key", "apikey", "WHISPARR_KEY"):
                 if k in redacted:
                     redacted[k] = "***REDACTED***"
-            text = json.dumps(redacted, default=str)
+            text = _json_dumps(redacted)
         else:
-            text = json.dumps(data, default=str)
+            text = _json_dumps(data)
         return text if len(text) <= max_len else text[:max_len] + "...(truncated)"
     except TypeError:
         return "<unserializable>"
@@ -178,19 +230,73 @@ def safe_json_preview(data: Any) -> str:
 # =========================
 # Logging
 # =========================
+_SCENE_ID: ContextVar[str] = ContextVar("scene_id", default="")
+
+
 def switch_scene_log(logger: logging.Logger, scene_id: int):
-    """Switch the log file to a new scene-specific file."""
+    """Route subsequent records in this context to the scene's log file."""
+    _SCENE_ID.set(str(scene_id))
+    logger.info("Logging switched to scene %s", scene_id)
+
+
+def release_scene_log(logger: logging.Logger, scene_id: int):
+    """Close a finished scene's log file and route back to the run log."""
+    scene_key = str(scene_id)
+    _SCENE_ID.set("")
     for handler in logger.handlers:
-        if isinstance(handler, logging.FileHandler):
-            base_dir = Path(handler.baseFilename).parent
-            new_file = base_dir / f"scene_{scene_id}.log"
-            # Close current file and reassign
+        if isinstance(handler, SceneRoutingHandler):
+            handler.release_scene(scene_key)
+
+
+class SceneRoutingHandler(logging.Handler):
+    """
+    Dispatch records to per-scene FileHandlers cached by scene id.
+
+    Replaces the old close/reopen of one FileHandler per scene: a
+    scene's file is opened once while that scene is in flight, and
+    routing by ContextVar stays correct when scenes are processed
+    concurrently. Callers release a scene's handler when the scene
+    finishes, so open fds stay bounded by in-flight scenes rather than
+    growing with the run.
+    """
+
+    def __init__(self, base_dir: Path, formatter: logging.Formatter, level: int):
+        super().__init__(level)
+        self.base_dir = base_dir
+        self.setFormatter(formatter)
+        self._handlers: Dict[str, logging.FileHandler] = {}
+
+    def _handler_for(self, scene_id: str) -> logging.FileHandler:
+        handler = self._handlers.get(scene_id)
+        if handler is None:
+            name = f"scene_{scene_id}.log" if scene_id else "Whisparrsync.log"
+            handler = logging.FileHandler(self.base_dir / name, encoding="utf-8")
+            handler.setFormatter(self.formatter)
+            handler.setLevel(self.level)
+            self._handlers[scene_id] = handler
+        return handler
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._handler_for(_SCENE_ID.get()).emit(record)
+        except Exception:
+            self.handleError(record)
+
+    def release_scene(self, scene_id: str) -> None:
+        """Close and evict the scene's handler once the scene is done."""
+        self.acquire()
+        try:
+            handler = self._handlers.pop(scene_id, None)
+        finally:
+            self.release()
+        if handler is not None:
+            handler.close()
+
+    def close(self) -> None:
+        for handler in self._handlers.values():
             handler.close()
-            handler.baseFilename = str(new_file)
-            handler.stream = handler._open()
-            logger.info(f"Logging switched to scene {scene_id}")
-            return
-    raise RuntimeError("No FileHandler found to switch log file")
+        self._handlers.clear()
+        super().close()
 
 
 class ColoredFormatter(logging.Formatter):
@@ -206,14 +312,23 @@ class ColoredFormatter(logging.Formatter):
     def __init__(self, fmt=None, use_color=True):
         super().__init__(fmt)
         self.use_color = use_color
+        # Precomputed per-level (color, reset) pairs so format() does a
+        # single dict lookup and concat per record.
+        reset = self.LOG_COLORS["RESET"]
+        self._level_codes = {
+            lvl: (color, reset)
+            for lvl, color in self.LOG_COLORS.items()
+            if lvl != "RESET"
+        }
 
     def format(self, record: logging.LogRecord) -> str:
         msg = super().format(record)
-        if self.use_color:
-            color = self.LOG_COLORS.get(record.levelname, "")
-            reset = self.LOG_COLORS["RESET"]
-            msg = f"{color}{msg}{reset}"
-        return msg
+        if not self.use_color:
+            return msg
+        codes = self._level_codes.get(record.levelname)
+        if codes is None:
+            return msg
+        return codes[0] + msg + codes[1]
 
 
 def setup_logger(config, default_scene_id: int = 0) -> logging.Logger:
@@ -222,18 +337,18 @@ def setup_logger(config, default_scene_id: int = 0) -> logging.Logger:
     logger.handlers.clear()
     logger.setLevel(logging.DEBUG)
 
-    # Determine log file path
+    # Determine log file location
     if config.LOG_FILE_ENABLE:
-        log_file_path = config.LOG_FILE_LOCATION / "Whisparrsync.log"
-        log_file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file_path, encoding="utf-8")
+        log_dir = config.LOG_FILE_LOCATION
+        log_dir.mkdir(parents=True, exist_ok=True)
         file_formatter = ColoredFormatter(
             "%(asctime)s - %(levelname)s - %(message)s",
             use_color=config.LOG_FILE_USE_COLOR,
         )
-        file_handler.setFormatter(file_formatter)
-        file_handler.setLevel(
-            getattr(logging, config.LOG_FILE_LEVEL.upper(), logging.DEBUG)
+        file_handler = SceneRoutingHandler(
+            log_dir,
+            file_formatter,
+            getattr(logging, config.LOG_FILE_LEVEL.upper(), logging.DEBUG),
         )
         logger.addHandler(file_handler)
 
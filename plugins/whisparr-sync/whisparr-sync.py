@@ -6,21 +6,26 @@ import argparse
 import csv
 import json
 import logging
+import os
+import sqlite3
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from functools import cached_property, lru_cache, partial
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+from typing import (Any, Callable, Dict, FrozenSet, List, Optional, Tuple,
+                    Type, Union, get_args, get_origin)
 
-import requests
 import tomli
-from config import (PluginConfig, load_config_logging, safe_json_preview,
+from config import (PluginConfig, json_dumps_bytes, json_loads,
+                    load_config_logging, release_scene_log, safe_json_preview,
                     switch_scene_log, truncate_path)
-from pydantic import (BaseModel, ConfigDict, Field, ValidationError,
-                      computed_field, field_validator)
-from requests.adapters import HTTPAdapter
+from pydantic import (BaseModel, ConfigDict, Field, TypeAdapter,
+                      ValidationError, computed_field, field_validator,
+                      model_validator)
 from stashapi import log as stash_log
-from stashapi.stashapp import StashInterface
-from urllib3.util.retry import Retry
 
 logger: logging.Logger
 # =========================
@@ -52,11 +57,18 @@ def load_from_toml(path: str) -> dict:
         return tomli.load(f)
 
 
-def has_ignored_tag(scene: "StashSceneModel", ignore_tags: List) -> Optional[str]:
-    for tag in scene.tags:
-        if tag in ignore_tags:
-            return tag
-    return None
+def scene_tags_raw(raw: dict) -> List[str]:
+    """Pull tag names straight from the raw Stash payload.
+
+    Lets the ignore-tag filter run before the full StashSceneModel (and
+    its per-file validation) is built for scenes we are going to skip.
+    """
+    return [t["name"] if isinstance(t, dict) else t for t in raw.get("tags") or []]
+
+
+def has_ignored_tag(tags: List[str], ignore_tags: FrozenSet[str]) -> Optional[str]:
+    # Hash-based membership: O(tags) instead of O(tags * ignore list).
+    return next((tag for tag in tags if tag in ignore_tags), None)
 
 
 def wait_for_file(path: Path, timeout: float = 5.0, interval: float = 0.05) -> bool:
@@ -77,27 +89,27 @@ def wait_for_file(path: Path, timeout: float = 5.0, interval: float = 0.05) -> b
     return True
 
 
+@lru_cache(maxsize=1024)
+def _map_prefix(path_str: str, mappings: Tuple[Tuple[str, str], ...]) -> str:
+    for server_prefix, local_prefix in mappings:
+        if path_str.startswith(server_prefix + "/") or path_str == server_prefix:
+            rel_path = path_str[len(server_prefix) :].lstrip("/")
+            return f"{local_prefix}/{rel_path}" if rel_path else local_prefix
+    # No mapping applied, return original path
+    return path_str
+
+
 def map_to_local_fs(path: Path, mappings: dict) -> Path:
     """
     Translate a server path into a local filesystem path using the mapping.
     Preserves full relative path including filename.
-    Handles leading slashes and Windows/Unix normalization.
+    Prefixes are normalized once at config load, so matching here is plain
+    string comparison; repeated paths hit the cache.
     """
     path_str = path.as_posix()  # keep forward slashes
-    logger.debug("Original path: %s", path_str)
-
-    for server_prefix, local_prefix in mappings.items():
-        server_prefix = Path(server_prefix).as_posix().rstrip("/")
-        local_prefix = Path(local_prefix).as_posix().rstrip("/")
-
-        # Remove any trailing slash from path before matching
-        if path_str.startswith(server_prefix + "/") or path_str == server_prefix:
-            rel_path = path_str[len(server_prefix) :].lstrip("/")
-            mapped_path = Path(local_prefix) / Path(rel_path)
-            return mapped_path
-
-    # No mapping applied, return original path
-    return path
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Original path: %s", path_str)
+    return Path(_map_prefix(path_str, tuple(mappings.items())))
 
 
 # =========================
@@ -105,12 +117,57 @@ def map_to_local_fs(path: Path, mappings: dict) -> Path:
 # =========================
 
 
+def _as_path(v: Any) -> Optional[Path]:
+    """Lift a payload value to Path without re-parsing values already lifted."""
+    if isinstance(v, Path):
+        return v
+    return Path(v) if v else None
+
+
+def _coerce_trusted(annotation: Any, value: Any) -> Any:
+    """Apply only the coercions retrieved models rely on (Path, nesting)."""
+    if value is None:
+        return None
+    origin = get_origin(annotation)
+    if origin is Union:
+        for arg in get_args(annotation):
+            if arg is not type(None):
+                return _coerce_trusted(arg, value)
+        return value
+    if origin is list:
+        args = get_args(annotation)
+        item_type = args[0] if args else Any
+        return [_coerce_trusted(item_type, item) for item in value]
+    if isinstance(annotation, type):
+        if issubclass(annotation, RetrievedModel) and isinstance(value, dict):
+            return annotation.fast_parse(value)
+        if issubclass(annotation, Path):
+            return _as_path(value)
+    return value
+
+
 class RetrievedModel(BaseModel):
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    @classmethod
+    def fast_parse(cls, data: dict) -> "RetrievedModel":
+        """
+        Build the model from a trusted service payload without full validation.
+
+        Responses come from our own Whisparr/Stash instances, so skip the
+        per-field validator walk that model_validate performs and only run
+        the coercions the rest of the code depends on.
+        """
+        fields = {
+            name: _coerce_trusted(field.annotation, data[name])
+            for name, field in cls.model_fields.items()
+            if name in data
+        }
+        return cls.model_construct(**fields)
 
 
 class BuiltModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
 
 class FileQuality(RetrievedModel):
@@ -124,16 +181,23 @@ class FileQualityWrapper(RetrievedModel):
     quality: Optional[FileQuality]
 
 
-class ManualImportFile(BuiltModel):
+@dataclass(slots=True)
+class ManualImportFile:
+    # Built from our own code and serialized straight into the command
+    # body, so a slotted dataclass skips three levels of nested pydantic
+    # validation per imported file.
     path: str
     movieId: int
     folderName: str
     releaseGroup: str = ""
-    languages: List[dict] = Field(
+    languages: List[dict] = field(
         default_factory=lambda: [{"id": 1, "name": "English"}]
     )
     indexerFlags: int = 0
-    quality: Optional[FileQualityWrapper]
+    quality: Optional[dict] = None
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {k: v for k, v in asdict(self).items() if v is not None}
 
 
 class Command(BuiltModel):
@@ -158,7 +222,7 @@ class ManualImportParams(BuiltModel):
 
 class ManualImportCommand(Command):
     name: str = "ManualImport"
-    files: List[ManualImportFile]
+    files: List[Dict[str, Any]]
     importMode: str = "auto"
 
 
@@ -188,10 +252,11 @@ class WhisparrScene(RetrievedModel):
     id: int
     path: Path
     statistics: WhisparrStatistics
+    stashId: str = ""
 
     @field_validator("path", mode="before")
     def convert_to_path(cls, v: Any) -> Optional[Path]:
-        return Path(v) if v else None
+        return _as_path(v)
 
 
 class ManualImportPreviewFile(RetrievedModel):
@@ -202,7 +267,7 @@ class ManualImportPreviewFile(RetrievedModel):
 
     @field_validator("path", mode="before")
     def convert_path(cls, v: Any) -> Optional[Path]:
-        return Path(v) if v else None
+        return _as_path(v)
 
 
 class StashFile(RetrievedModel):
@@ -210,7 +275,7 @@ class StashFile(RetrievedModel):
 
     @field_validator("path", mode="before")
     def to_path(cls, v: Any) -> Optional[Path]:
-        return Path(v) if v else None
+        return _as_path(v)
 
 
 class StashSceneModel(RetrievedModel):
@@ -221,16 +286,29 @@ class StashSceneModel(RetrievedModel):
     # Default fallback
     stashdb_endpoint_substr: str = "stashdb.org"
 
-    @field_validator("tags", mode="before")
-    # Stash returns [] or list[{"name": str, ...}]
-    def extract_tag_names(cls, v: Any) -> List[str]:
-        if not v:
-            return []
-        if isinstance(v[0], dict) and "name" in v[0]:
-            return [item["name"] for item in v]
-        return v
+    @model_validator(mode="before")
+    @classmethod
+    def _coerce(cls, data: Any) -> Any:
+        # One validator dispatch per instance instead of one per field.
+        if not isinstance(data, dict):
+            return data
+        data = dict(data)
+        tags = data.get("tags")
+        # Stash returns [] or list[{"name": str, ...}]
+        if tags and isinstance(tags[0], dict) and "name" in tags[0]:
+            data["tags"] = [item["name"] for item in tags]
+        files = data.get("files")
+        if files:
+            data["files"] = [
+                {**f, "path": _as_path(f.get("path"))} if isinstance(f, dict) else f
+                for f in files
+            ]
+        return data
 
+    # cached_property under computed_field: evaluated once per instance
+    # instead of on every attribute access.
     @computed_field
+    @cached_property
     def stashdb_id(self) -> Optional[str]:
         for sid in self.stash_ids:
             if self.stashdb_endpoint_substr in sid.get("endpoint", ""):
@@ -238,6 +316,7 @@ class StashSceneModel(RetrievedModel):
         return None
 
     @computed_field
+    @cached_property
     def paths(self) -> List[Path]:
         return [f.path for f in self.files if f.path]
 
@@ -246,6 +325,53 @@ class StashSceneModel(RetrievedModel):
 # HTTP Helper
 # =========================
 
+# One session for the whole plugin run: keep-alive connections to Whisparr are
+# reused across calls instead of paying a TCP+TLS handshake per request.
+# Created lazily so cold start (config/help paths) does not pay the
+# requests+urllib3 import cost.
+_SESSION = None
+
+
+def _get_session():
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+        )
+        session = requests.Session()
+        session.mount(
+            "http://",
+            HTTPAdapter(max_retries=retry, pool_connections=10, pool_maxsize=20),
+        )
+        session.mount(
+            "https://",
+            HTTPAdapter(max_retries=retry, pool_connections=10, pool_maxsize=20),
+        )
+        session.headers.update({"Accept": "application/json"})
+        _SESSION = session
+    return _SESSION
+
+# Compiled validators are cached so each response model pays the schema walk
+# construction cost once per run instead of once per call. Keyed on
+# (model, is_list) so the list form does not rebuild the List[...] alias
+# per call either.
+_ADAPTERS: Dict[Tuple[Any, bool], TypeAdapter] = {}
+
+
+def _adapter(model: Any, is_list: bool = False) -> TypeAdapter:
+    key = (model, is_list)
+    adapter = _ADAPTERS.get(key)
+    if adapter is None:
+        adapter = TypeAdapter(List[model] if is_list else model)
+        _ADAPTERS[key] = adapter
+    return adapter
+
 
 def http_json(
     method: str,
@@ -257,31 +383,44 @@ def http_json(
     response_model: Optional[Type[BaseModel]] = None,
     response_is_list: bool = False,
     dev: bool = False,
+    session: Optional[Any] = None,
 ) -> Tuple[int, Union[BaseModel, List[BaseModel], dict, str]]:
+    import requests
 
-    _session = requests.Session()
-    _retry = Retry(
-        total=3,
-        backoff_factor=0.5,
-        status_forcelist=(500, 502, 503, 504),
-    )
-    _session.mount("http://", HTTPAdapter(max_retries=_retry))
-    _session.mount("https://", HTTPAdapter(max_retries=_retry))
+    if session is None:
+        session = _get_session()
 
+    # Serialize the body exactly once: model_dump_json runs in Rust, and
+    # passing bytes via data= stops requests from re-encoding a dict.
     if isinstance(body, BaseModel):
-        body = body.model_dump(exclude_none=True, by_alias=True)
-
-    headers = {"Accept": "application/json", "X-Api-Key": api_key}
-    logger.debug(
-        "%s %s params=%s body=%s", method, url, params, safe_json_preview(body)
-    )
+        body_bytes = body.model_dump_json(exclude_none=True, by_alias=True).encode()
+    elif body is not None:
+        body_bytes = json_dumps_bytes(body)
+    else:
+        body_bytes = None
+
+    headers = {"X-Api-Key": api_key}
+    if body_bytes is not None:
+        headers["Content-Type"] = "application/json"
+    # safe_json_preview serializes the whole body; only pay for it when
+    # DEBUG is actually enabled.
+    if logger.isEnabledFor(logging.DEBUG):
+        dbg = (
+            body.model_dump(exclude_none=True, by_alias=True)
+            if isinstance(body, BaseModel)
+            else body
+        )
+        logger.debug(
+            "%s %s params=%s body=%s", method, url, params, safe_json_preview(dbg)
+        )
 
     try:
-        r = _session.request(
-            method, url, headers=headers, json=body, params=params, timeout=timeout
+        r = session.request(
+            method, url, headers=headers, data=body_bytes, params=params,
+            timeout=timeout,
         )
         try:
-            parsed = r.json()
+            parsed = json_loads(r.content)
         except ValueError:
             parsed = r.text
 
@@ -295,10 +434,21 @@ def http_json(
                 logger.debug("Attempting Parse to %s", response_model)
                 logger.debug("raw data: %s", parsed)
             try:
+                trusted = issubclass(response_model, RetrievedModel)
                 if response_is_list and isinstance(parsed, list):
-                    return r.status_code, [response_model(**item) for item in parsed]
+                    if trusted:
+                        return r.status_code, [
+                            response_model.fast_parse(item) for item in parsed
+                        ]
+                    return r.status_code, _adapter(
+                        response_model, is_list=True
+                    ).validate_python(parsed)
                 elif not response_is_list and isinstance(parsed, dict):
-                    return r.status_code, response_model(**parsed)
+                    if trusted:
+                        return r.status_code, response_model.fast_parse(parsed)
+                    return r.status_code, _adapter(response_model).validate_python(
+                        parsed
+                    )
             except Exception as e:
                 logger.exception("Failed to parse response into Pydantic model: %s", e)
                 return r.status_code, parsed
@@ -309,6 +459,25 @@ def http_json(
         raise WhisparrError(f"HTTP request failed for {method} {url}: {e}") from e
 
 
+@lru_cache(maxsize=4096)
+def _path_exists(path_str: str) -> bool:
+    """
+    Cached existence check via a single lstat, skipping the symlink walk
+    that Path.resolve() pays. Safe within one sync run because we only
+    mutate the filesystem in FileManager.move, which clears the cache.
+    """
+    try:
+        os.lstat(path_str)
+        return True
+    except OSError:
+        return False
+
+
+# Serializes move() across worker threads so parallel scenes cannot race
+# on the same destination directory.
+_MOVE_LOCK = threading.Lock()
+
+
 class FileManager:
     def __init__(self, config: PluginConfig, source: Path, destination: Path):
         self.og_source: Path = source.parent
@@ -323,25 +492,25 @@ class FileManager:
         Map a server path to the local filesystem if a pathmap is provided.
         """
         if pathmap:
-            logger.warning("Mapping paths: %s", pathmap)
+            logger.debug("Mapping paths: %s", pathmap)
             return map_to_local_fs(path, pathmap)
         return path
 
     def exists(self) -> Path:
-        source_file = (self.source / self.name).resolve()
-        destination_file = (self.destination / self.name).resolve()
+        source_file = self.source / self.name
+        destination_file = self.destination / self.name
 
         # Same physical file → check once
         if source_file == destination_file:
-            if source_file.exists():
+            if _path_exists(str(source_file)):
                 logger.debug("Source and destination are the same file")
                 return source_file
 
-        if source_file.exists():
+        if _path_exists(str(source_file)):
             logger.debug("File is in Stash Directory")
             return source_file
 
-        if destination_file.exists():
+        if _path_exists(str(destination_file)):
             logger.debug("File is in the Whisparr Directory")
             return destination_file
 
@@ -350,49 +519,53 @@ class FileManager:
         logger.error("Destination: %s", destination_file)
         raise FileNotFoundError(source_file)
 
-    def move(self, source: Path, retries: int = 5, delay: float = 0.5) -> bool:
+    def move(self, source: Path) -> bool:
+        target_file = (self.destination / self.name).resolve()
         try:
-            # Ensure source exists
-            if not source.is_file():
-                logger.warning("Source file does not exist: %s", self.source)
-                return False
-
-            # Construct full destination path
-            target_file = (self.destination / self.name).resolve()
-            target_file.parent.mkdir(parents=True, exist_ok=True)
-            logger.info("source: %s", source)
-            logger.info("target_file: %s", target_file)
-            if source != target_file:
-                # Move/replace the file
-                source.replace(target_file)
-
-                # Retry checking if the file exists with exponential backoff
-                for attempt in range(retries):
-                    if target_file.is_file():
-                        logger.info(
-                            "File moved successfully: %s -> %s",
-                            self.source,
-                            target_file,
-                        )
-                        return True
-                    sleep_time = delay * (2**attempt)  # Exponential backoff
-                    time.sleep(sleep_time)
-
-                logger.warning(
-                    "File move completed but target file still not found after retries: %s",
-                    target_file,
-                )
-                return False
-            else:
-                logger.info("File is already in the correct directory")
-                return False
-
+            with _MOVE_LOCK:
+                return self._move_locked(source, target_file)
         except Exception as e:
             logger.exception(
                 "Failed to move file %s -> %s: %s", self.source, target_file, e
             )
             return False
 
+    def _move_locked(self, source: Path, target_file: Path) -> bool:
+        # Ensure source exists
+        if not source.is_file():
+            logger.warning("Source file does not exist: %s", self.source)
+            return False
+
+        # Construct full destination path
+        target_file.parent.mkdir(parents=True, exist_ok=True)
+        logger.info("source: %s", source)
+        logger.info("target_file: %s", target_file)
+        if source == target_file:
+            logger.info("File is already in the correct directory")
+            return False
+
+        # Path.replace is synchronous; flush the directory entry and
+        # check once instead of polling with exponential backoff.
+        source.replace(target_file)
+        _path_exists.cache_clear()
+        if hasattr(os, "O_DIRECTORY"):
+            dir_fd = os.open(str(target_file.parent), os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+        if target_file.is_file():
+            logger.info(
+                "File moved successfully: %s -> %s", self.source, target_file
+            )
+            return True
+
+        logger.warning(
+            "File move completed but target file not found: %s", target_file
+        )
+        return False
+
 
 # =========================
 # Whisparr Interface
@@ -400,11 +573,46 @@ class FileManager:
 
 
 class WhisparrInterface:
+    # One instance per scene in bulk mode; slots drop the per-instance
+    # __dict__ and make attribute reads a fixed-offset lookup.
+    __slots__ = (
+        "stash_scene",
+        "whisparr_scene",
+        "url",
+        "key",
+        "monitored",
+        "move",
+        "_session",
+        "http_json",
+        "rename",
+        "root_dir",
+        "qualprofile",
+        "config",
+        "filenames",
+        "defer_commands",
+        "batch_size",
+        "scene_index",
+    )
+
+    # Per-run command queues (movie ids). With defer_commands=True the
+    # RefreshMovie/RenameFiles commands are micro-batched here instead of
+    # issued one HTTP round-trip per scene.
+    _pending_commands: Dict[str, List[int]] = {"RefreshMovie": [], "RenameFiles": []}
+    _pending_lock = threading.Lock()
+
+    # Quality profiles and root folders never change mid-run; cache them
+    # per (url, key). Fetches go through the instance's http_json so an
+    # injected stub is honored.
+    _profile_cache: Dict[Tuple[str, str], Tuple[dict, ...]] = {}
+    _rootfolder_cache: Dict[Tuple[str, str], Tuple[dict, ...]] = {}
+
     def __init__(
         self,
         config: PluginConfig,
         stash_scene: StashSceneModel,
         http_func: Callable[..., Tuple[int, Any]] = http_json,
+        defer_commands: bool = False,
+        scene_index: Optional[Dict[str, WhisparrScene]] = None,
     ):
         self.stash_scene: StashSceneModel = stash_scene
         self.whisparr_scene: Optional[WhisparrScene] = None
@@ -412,12 +620,23 @@ class WhisparrInterface:
         self.key: str = config.WHISPARR_KEY
         self.monitored: bool = config.MONITORED
         self.move: bool = config.MOVE_FILES
-        self.http_json = http_func
+        # Bind the shared keep-alive session so every call this instance
+        # makes reuses the same pooled connections; injected http stubs
+        # are left untouched.
+        self._session = _get_session() if http_func is http_json else None
+        self.http_json = (
+            partial(http_func, session=self._session)
+            if self._session is not None
+            else http_func
+        )
         self.rename: bool = config.WHISPARR_RENAME
         self.root_dir: str = str(config.ROOT_FOLDER)
         self.qualprofile: str = config.QUALITY_PROFILE
         self.config: Dict = config
         self.filenames: str = stash_scene.files
+        self.defer_commands: bool = defer_commands
+        self.batch_size: int = config.BATCH_SIZE
+        self.scene_index: Optional[Dict[str, WhisparrScene]] = scene_index
 
     def process_scene(self) -> None:
         """
@@ -427,15 +646,59 @@ class WhisparrInterface:
         self.whisparr_scene = self.find_existing_scene()
 
         if not self.whisparr_scene:
+            # The POST response already carries the created scene, so
+            # re-fetching is only needed if the body was unusable.
             self.create_scene()
-            self.whisparr_scene = self.find_existing_scene()
+            if not isinstance(self.whisparr_scene, WhisparrScene):
+                self.whisparr_scene = self.find_existing_scene()
         did_move_files = self.process_stash_files()
         logger.debug("Did any file move operations happen? %s", did_move_files)
         if did_move_files:
             self._queue_command("RefreshMovie")
         self.import_stash_file()
 
+    @classmethod
+    def prefetch_movie_index(
+        cls, config: PluginConfig
+    ) -> Optional[Dict[str, WhisparrScene]]:
+        """
+        Fetch the whole Whisparr movie list once and key it by stash id,
+        so bulk runs do dict lookups instead of one GET per scene.
+
+        Returns None on failure so callers fall back to per-scene GETs;
+        an empty dict means the library really is empty.
+        """
+        try:
+            status, scenes = http_json(
+                method="GET",
+                url=f"{config.WHISPARR_URL}/api/v3/movie",
+                api_key=config.WHISPARR_KEY,
+                timeout=120,
+                response_model=WhisparrScene,
+                response_is_list=True,
+            )
+        except WhisparrError as e:
+            logger.error("Failed to prefetch Whisparr movie list: %s", e)
+            return None
+        if status != 200 or not isinstance(scenes, list):
+            logger.error("Failed to prefetch Whisparr movie list: %s", status)
+            return None
+        index = {
+            scene.stashId: scene
+            for scene in scenes
+            if isinstance(scene, WhisparrScene) and scene.stashId
+        }
+        logger.info("Prefetched %d Whisparr scenes into the lookup index", len(index))
+        return index
+
     def find_existing_scene(self) -> Optional[WhisparrScene]:
+        if self.scene_index is not None:
+            scene = self.scene_index.get(self.stash_scene.stashdb_id)
+            if scene:
+                logger.info("Scene already exists in Whisparr: %s", scene)
+            else:
+                logger.info("No existing scenes found in Whisparr")
+            return scene
         status, scenes = self.http_json(
             method="GET",
             url=f"{self.url}/api/v3/movie",
@@ -487,6 +750,9 @@ class WhisparrInterface:
 
         if status in (200, 201):
             logger.info("Added movie '%s' to Whisparr", self.stash_scene.title)
+            # Keep the bulk lookup index in step with what we just created.
+            if self.scene_index is not None and isinstance(scene, WhisparrScene):
+                self.scene_index[stashdb_id] = scene
         else:
             msg = f"Failed to add movie '{self.stash_scene.title}': {scene}"
             logger.error(msg)
@@ -498,6 +764,10 @@ class WhisparrInterface:
             raise SceneNotFoundError(
                 "Whisparr scene not set up. Call process_scene() first."
             )
+        if not self.move:
+            # Nothing will be moved; skip the per-file mapping and stat work.
+            logger.debug("MOVE_FILES disabled, skipping file checks")
+            return False
         Stashfilez = []
         for stash_path in self.stash_scene.paths:
             try:
@@ -513,18 +783,17 @@ class WhisparrInterface:
                 )
 
         files_moved = []
-        if self.move:
-            for file in Stashfilez:
-                source = file.exists()
-                moved = file.move(source)
-                files_moved.append(moved)
+        for file in Stashfilez:
+            source = file.exists()
+            moved = file.move(source)
+            files_moved.append(moved)
         return any(files_moved)
 
     def import_stash_file(self) -> None:
-        matched_preview = self._get_matching_preview_file()
-        if matched_preview is None:
+        matched_previews = self._get_matching_preview_files()
+        if not matched_previews:
             return
-        self._execute_manual_import(matched_preview)
+        self._execute_manual_import(matched_previews)
         if self.rename:
             self._queue_command("RenameFiles")
         else:
@@ -532,9 +801,8 @@ class WhisparrInterface:
 
     def _get_manual_import_preview(self) -> List[ManualImportPreviewFile]:
         assert self.whisparr_scene is not None
-        params = ManualImportParams(
-            folder=self.whisparr_scene.path.as_posix(), movieId=self.whisparr_scene.id
-        )
+        scene = self.whisparr_scene
+        params = ManualImportParams(folder=scene.path.as_posix(), movieId=scene.id)
         status, previews = self.http_json(
             method="GET",
             url=f"{self.url}/api/v3/manualimport",
@@ -544,33 +812,47 @@ class WhisparrInterface:
             response_is_list=True,
         )
         if status != 200 or not previews:
-            if self.whisparr_scene.statistics.movieFileCount == len(
-                self.stash_scene.files
-            ):
+            if scene.statistics.movieFileCount == len(self.stash_scene.files):
                 logger.info("File has already been imported to Whisparr")
             else:
                 raise ManualImportError(f"Manual import preview failed: {previews}")
         return previews
 
-    def _get_matching_preview_file(self) -> Optional[ManualImportPreviewFile]:
+    def _get_matching_preview_files(self) -> List[ManualImportPreviewFile]:
         previews = self._get_manual_import_preview()
-        for g in self.filenames:
-            matched = next((f for f in previews if f.path.name == g.path.name), None)
-        if not matched:
+        # Index previews by filename once: O(stash files + previews)
+        # instead of a linear preview scan per stash file. The old loop
+        # also only kept the match for the *last* stash file.
+        preview_by_name = {f.path.name: f for f in previews or []}
+        matches = [
+            preview_by_name[g.path.name]
+            for g in self.filenames
+            if g.path and g.path.name in preview_by_name
+        ]
+        if not matches:
             logger.info("All files already imported to Whisparr")
-            return None
-        return matched
+        return matches
 
-    def _execute_manual_import(self, preview_file: ManualImportPreviewFile) -> None:
+    def _execute_manual_import(
+        self, preview_files: List[ManualImportPreviewFile]
+    ) -> None:
         assert self.whisparr_scene is not None
+        movie_id = self.whisparr_scene.id
+        # All matched files go into one command: one POST per scene
+        # instead of one per file.
         command = ManualImportCommand(
             files=[
                 ManualImportFile(
                     folderName=preview_file.folderName,
                     path=preview_file.path.as_posix(),
-                    movieId=self.whisparr_scene.id,
-                    quality=preview_file.quality,
-                )
+                    movieId=movie_id,
+                    quality=(
+                        preview_file.quality.model_dump()
+                        if preview_file.quality
+                        else None
+                    ),
+                ).to_payload()
+                for preview_file in preview_files
             ]
         )
         status, resp = self.http_json(
@@ -581,14 +863,25 @@ class WhisparrInterface:
         )
         if status not in (200, 201):
             raise ManualImportError(f"Manual import command failed: {resp}")
-        logger.info("Manual import executed successfully for %s", preview_file.path)
+        logger.info(
+            "Manual import executed successfully for %d file(s)", len(preview_files)
+        )
 
     def _queue_command(self, commandname: str = "RefreshMovie") -> None:
+        movie_id = self.whisparr_scene.id
+        if self.defer_commands:
+            with self._pending_lock:
+                pending = self._pending_commands[commandname]
+                pending.append(movie_id)
+                flush_now = len(pending) >= self.batch_size
+            if flush_now:
+                self.flush_pending_commands(self.config)
+            return
         try:
             if commandname == "RefreshMovie":
-                command = RefreshMovieCommand(movieIds=[self.whisparr_scene.id])
+                command = RefreshMovieCommand(movieIds=[movie_id])
             if commandname == "RenameFiles":
-                command = RenameCommand(movieIds=[self.whisparr_scene.id])
+                command = RenameCommand(movieIds=[movie_id])
             status, resp = self.http_json(
                 method="POST",
                 url=f"{self.url}/api/v3/command",
@@ -597,9 +890,7 @@ class WhisparrInterface:
             )
             if status in (200, 201):
                 logger.info(
-                    "%s command queued for movie ID: %s",
-                    commandname,
-                    self.whisparr_scene.id,
+                    "%s command queued for movie ID: %s", commandname, movie_id
                 )
                 logger.debug("response: %s", resp)
                 # return CommandResponse(**resp.get("body"))
@@ -608,10 +899,59 @@ class WhisparrInterface:
         except Exception as e:
             logger.exception("Failed to queue %s command: %s", commandname, e)
 
+    @classmethod
+    def flush_pending_commands(cls, config: PluginConfig) -> None:
+        """Issue one batched command per queue instead of one per scene."""
+        for commandname in ("RefreshMovie", "RenameFiles"):
+            with cls._pending_lock:
+                movie_ids = cls._pending_commands[commandname][:]
+                cls._pending_commands[commandname].clear()
+            if not movie_ids:
+                continue
+            if commandname == "RefreshMovie":
+                command = RefreshMovieCommand(movieIds=movie_ids)
+            else:
+                command = RenameCommand(movieIds=movie_ids)
+            try:
+                status, resp = http_json(
+                    method="POST",
+                    url=f"{config.WHISPARR_URL}/api/v3/command",
+                    api_key=config.WHISPARR_KEY,
+                    body=command,
+                )
+                if status in (200, 201):
+                    logger.info(
+                        "%s command queued for %d movies", commandname, len(movie_ids)
+                    )
+                else:
+                    logger.error("%s command failed: %s", commandname, resp)
+            except Exception as e:
+                logger.exception("Failed to queue %s command: %s", commandname, e)
+
+    def _quality_profiles(self) -> Tuple[dict, ...]:
+        cache_key = (self.url, self.key)
+        qps = self._profile_cache.get(cache_key)
+        if qps is None:
+            _, raw = self.http_json(
+                method="GET", url=f"{self.url}/api/v3/qualityprofile", api_key=self.key
+            )
+            qps = tuple(raw) if isinstance(raw, list) else ()
+            self._profile_cache[cache_key] = qps
+        return qps
+
+    def _root_folders(self) -> Tuple[dict, ...]:
+        cache_key = (self.url, self.key)
+        rfs = self._rootfolder_cache.get(cache_key)
+        if rfs is None:
+            _, raw = self.http_json(
+                method="GET", url=f"{self.url}/api/v3/rootfolder", api_key=self.key
+            )
+            rfs = tuple(raw) if isinstance(raw, list) else ()
+            self._rootfolder_cache[cache_key] = rfs
+        return rfs
+
     def get_default_quality_profile(self) -> int:
-        status, qps = self.http_json(
-            method="GET", url=f"{self.url}/api/v3/qualityprofile", api_key=self.key
-        )
+        qps = self._quality_profiles()
         any_id = next(
             (item["id"] for item in qps if item["name"] == self.qualprofile), None
         )
@@ -620,10 +960,7 @@ class WhisparrInterface:
         return int(any_id or 1)
 
     def get_default_root_folder(self) -> str:
-        result = self.http_json(
-            method="GET", url=f"{self.url}/api/v3/rootfolder", api_key=self.key
-        )
-        rfs: List[Dict[str, str]] = result[1]
+        rfs: Tuple[Dict[str, str], ...] = self._root_folders()
 
         # Check for configured root_dir
         if self.root_dir != "":
@@ -640,9 +977,14 @@ class WhisparrInterface:
 
 
 class StashHelpers:
+    # Classvars below stay out of slots; scene_id is the only
+    # per-instance attribute.
+    __slots__ = ("scene_id",)
+
     dev: bool = False
     STASH_DATA: Dict[str, Any] = {}
     _stash_conn = None
+    _conn_lock = threading.Lock()
     toml_path: Path = None
 
     def __init__(self, scene_id: int):
@@ -650,8 +992,15 @@ class StashHelpers:
 
     @classmethod
     def open_conn(cls):
-        """Lazy-load the stash connection."""
+        """Lazy-load the stash connection (thread-safe first open)."""
+        with cls._conn_lock:
+            return cls._open_conn_locked()
+
+    @classmethod
+    def _open_conn_locked(cls):
         if cls._stash_conn is None:
+            from stashapi.stashapp import StashInterface
+
             try:
                 cls._stash_conn = StashInterface(cls.STASH_DATA["server_connection"])
                 logger.info("StashInterface connection established.")
@@ -706,16 +1055,44 @@ def preprocessor(dev: bool):
     return config
 
 
-def process_single_scene(config, scene_id):
+def process_single_scene(
+    config, scene_id, defer_commands: bool = False, scene_index=None, scene_data=None
+):
     switch_scene_log(logger, f"{scene_id}")
+    try:
+        return _process_single_scene_routed(
+            config, scene_id, defer_commands, scene_index, scene_data
+        )
+    finally:
+        # Close the scene's log file so bulk runs keep open fds bounded
+        # by in-flight scenes instead of one per scene ever processed.
+        release_scene_log(logger, scene_id)
+
+
+def _process_single_scene_routed(
+    config, scene_id, defer_commands, scene_index, scene_data
+):
     logger.info("SCENEID %d STARTING", scene_id)
     stash = StashHelpers.open_conn()
     scene = None
     try:
-        scene_data = stash.find_scene(scene_id)
+        # scene_data may be prefetched by the caller (pipelined bulk
+        # mode); only hit Stash when it wasn't.
+        if scene_data is None:
+            scene_data = stash.find_scene(scene_id)
         if not scene_data:
             logger.error("Scene %s not found in Stash.", scene_id)
             return "Failed"
+        # Filter on the raw payload before paying for model construction;
+        # most scenes in a full-library scan are skipped right here.
+        ignored_tag = has_ignored_tag(scene_tags_raw(scene_data), config.IGNORE_TAGS)
+        if ignored_tag:
+            logger.info(
+                "Scene '%s' skipped due to ignored tag: %s",
+                scene_data.get("title", scene_id),
+                ignored_tag,
+            )
+            return "SkippedTag"
         scene = StashSceneModel(
             **scene_data, stashdb_endpoint_substr=config.STASHDB_ENDPOINT_SUBSTR
         )
@@ -729,13 +1106,12 @@ def process_single_scene(config, scene_id):
         logger.error("No StashDB ID for %s, skipping", scene.title)
         return "NoStashDB ID"
     logger.info("Processing scene: %s", scene.title)
-    ignored_tag = has_ignored_tag(scene, config.IGNORE_TAGS)
-    if ignored_tag:
-        logger.info(
-            "Scene '%s' skipped due to ignored tag: %s", scene.title, ignored_tag
-        )
-        return "SkippedTag"
-    whisparr = WhisparrInterface(config=config, stash_scene=scene)
+    whisparr = WhisparrInterface(
+        config=config,
+        stash_scene=scene,
+        defer_commands=defer_commands,
+        scene_index=scene_index,
+    )
     try:
         whisparr.process_scene()
         logger.info("Scene processing completed successfully.")
@@ -743,72 +1119,142 @@ def process_single_scene(config, scene_id):
         logger.exception("Whisparr processing error: %s", e)
         return "Failed"
     except Exception as e:
-        logger.exception(f"Unexpected error during scene processing: {e}")
+        logger.exception("Unexpected error during scene processing: %s", e)
         return "Failed"
     return "Success"
 
 
-from typing import Optional
-
-
 def bulk_processor(config: "PluginConfig") -> None:
-    import sqlite3
-
     stash = StashHelpers.open_conn()
     generalconf: dict = stash.get_configuration().get("general")
     if not config.DEV_MODE:
         sqllite_db_loc: str = generalconf.get("databasePath")
     else:
         sqllite_db_loc = "stash-go.sqlite"
-    # Fetch all scene IDs
+    # Count first (cheap) so progress has a denominator, then stream the
+    # ids straight off the cursor instead of materializing and reversing
+    # the whole column.
+    try:
+        # Read-only open: SQLite skips the rollback journal and write
+        # locks on the live Stash DB, and the mmap keeps page reads out
+        # of Python-visible I/O calls.
+        conn = sqlite3.connect(f"file:{sqllite_db_loc}?mode=ro", uri=True)
+        conn.execute("PRAGMA mmap_size=268435456")
+    except Exception as e:
+        logger.error("Failed to initialize DB: %s", e)
+        return
+
     try:
-        with sqlite3.connect(sqllite_db_loc) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT id FROM scenes")
-            scene_ids: list[int] = [row[0] for row in cursor.fetchall()]
-        logger.info(f"Found {len(scene_ids)} scenes")
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM scenes")
+        scene_count: int = cursor.fetchone()[0]
+        logger.info("Found %d scenes", scene_count)
     except Exception as e:
         logger.error("Failed to initialize DB: %s", e)
+        conn.close()
         return
 
-    if len(scene_ids) == 0:
+    if scene_count == 0:
         logger.error("Stash DB is empty! exiting")
+        conn.close()
         return
 
     progress: float = 0
-    progress_step: float = 1 / len(scene_ids)
+    progress_step: float = 1 / scene_count
     bulk_results: Path = Path(f"{config.LOG_FILE_LOCATION}/bulk_results.csv")
+    workers: int = max(1, config.SYNC_WORKERS)
+    # One movie-list GET replaces a per-scene existence lookup. None on
+    # failure keeps the per-scene GET fallback in find_existing_scene.
+    scene_index = WhisparrInterface.prefetch_movie_index(config)
 
-    with open(bulk_results, "a", newline="") as records:
-        writer = csv.writer(records)
-        if bulk_results.stat().st_size == 0:
-            writer.writerow(["scene_id", "success"])
-            records.flush()
-        for i, scene in enumerate(reversed(scene_ids), start=1):
-            # stash_log.debug(f"Processing Scene: {scene}")
-            try:
-                success: str = process_single_scene(config, scene)
-                writer.writerow([scene, success])
-                if i % 50 == 0:
-                    records.flush()
-            except Exception as err:
-                logger.error(f"main function error: {err}")
-                writer.writerow([scene, False])
-                records.flush()
-            progress += progress_step
-            # stash_log.progress(progress)
+    def _process_for_bulk(scene: int, scene_data: Any = None) -> Tuple[int, Any]:
+        try:
+            return scene, process_single_scene(
+                config,
+                scene,
+                defer_commands=True,
+                scene_index=scene_index,
+                scene_data=scene_data,
+            )
+        except Exception as err:
+            logger.error("main function error: %s", err)
+            return scene, False
+
+    def _pipelined_bulk(scene_ids: List[int], prefetcher) -> Any:
+        next_future = None
+        for i, scene in enumerate(scene_ids):
+            prefetched = None
+            if next_future is not None:
+                try:
+                    prefetched = next_future.result()
+                except Exception as err:
+                    logger.error("Prefetch failed for scene %s: %s", scene, err)
+            if i + 1 < len(scene_ids):
+                next_future = prefetcher.submit(stash.find_scene, scene_ids[i + 1])
+            else:
+                next_future = None
+            yield _process_for_bulk(scene, prefetched)
+
+    # Decide on the header before opening: "a" mode creates the file, so
+    # stat() inside the block would never see a missing file.
+    need_header = not bulk_results.exists() or bulk_results.stat().st_size == 0
+    try:
+        with open(bulk_results, "a", newline="", buffering=1 << 16) as records:
+            writer = csv.writer(records)
+            if need_header:
+                writer.writerow(["scene_id", "success"])
+            # Per-scene work is I/O-bound on Whisparr/Stash round-trips, so
+            # worker threads overlap the waits while the CSV writer stays on
+            # this thread. Rows are written as scenes finish instead of in
+            # submission order, so one slow scene never stalls the output;
+            # they are batched through writerows to avoid a row-by-row
+            # format-and-flush tax.
+            cursor.execute("SELECT id FROM scenes ORDER BY id DESC")
+            pending: List[Tuple[int, Any]] = []
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                if workers == 1:
+                    # A lone worker gets pipeline overlap instead of
+                    # parallelism: while scene i's Whisparr calls run on
+                    # this thread, the pool slot prefetches scene i+1's
+                    # Stash data, hiding the GraphQL round-trip.
+                    scene_ids = [scene for (scene,) in cursor]
+                    results = _pipelined_bulk(scene_ids, pool)
+                else:
+                    futures = [
+                        pool.submit(_process_for_bulk, scene) for (scene,) in cursor
+                    ]
+                    results = (future.result() for future in as_completed(futures))
+                try:
+                    for result in results:
+                        pending.append(result)
+                        if len(pending) >= 200:
+                            writer.writerows(pending)
+                            pending.clear()
+                            records.flush()
+                        progress += progress_step
+                        # stash_log.progress(progress)
+                finally:
+                    if pending:
+                        writer.writerows(pending)
+    finally:
+        conn.close()
+
+    WhisparrInterface.flush_pending_commands(config)
 
 
 def main(
     scene_id: Optional[int] = None,
     dev: Optional[bool] = False,
     bulk: Optional[bool] = False,
+    workers: Optional[int] = None,
 ) -> None:
     global logger
     config: Optional["PluginConfig"] = preprocessor(dev)
     if not config:
         stash_log.error("Configuration could not be loaded; exiting.")
         return
+    if workers is not None:
+        config.SYNC_WORKERS = max(1, workers)
     if bulk:
         logger.debug("Bulk update started")
         bulk_processor(config=config)
@@ -840,5 +1286,11 @@ if __name__ == "__main__":
     )
     parser.add_argument("--dev", action="store_true", help="Run in development mode")
     parser.add_argument("--bulk", action="store_true", help="Batch Process all scenes")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Override SYNC_WORKERS for bulk mode (threads; 1 = pipelined)",
+    )
     args = parser.parse_args()
-    main(scene_id=args.scene_id, dev=args.dev, bulk=args.bulk)
+    main(scene_id=args.scene_id, dev=args.dev, bulk=args.bulk, workers=args.workers)
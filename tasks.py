@@ -3,13 +3,18 @@ import sys
 from pathlib import Path
 SOURCE_DIRS = ["plugins/whisparr-sync", "tests"]
 
-# Simple color helpers
-def color(text, code):
-    return f"\033[{code}m{text}\033[0m"
-
-def green(text): return color(text, "32")
-def red(text): return color(text, "31")
-def yellow(text): return color(text, "33")
+# Simple color helpers. Codes are module constants so each call is one
+# concat, and coloring is skipped entirely when output isn't a terminal
+# (piped/CI runs get plain text).
+_USE_COLOR = sys.stdout.isatty()
+_GREEN = "\033[32m"
+_RED = "\033[31m"
+_YELLOW = "\033[33m"
+_RESET = "\033[0m"
+
+def green(text): return f"{_GREEN}{text}{_RESET}" if _USE_COLOR else text
+def red(text): return f"{_RED}{text}{_RESET}" if _USE_COLOR else text
+def yellow(text): return f"{_YELLOW}{text}{_RESET}" if _USE_COLOR else text
 
 def run_cmd(c, cmd, halt_on_fail=True):
     """Run a shell command and optionally stop on failure."""